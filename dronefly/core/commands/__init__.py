@@ -25,7 +25,7 @@ from ..formatters.generic import (
     ObservationFormatter,
     TaxonFormatter,
     UserFormatter,
-    p,
+    inflect_engine,
 )
 from ..models.config import Config
 from ..models.user import User
@@ -296,7 +296,7 @@ class Commands:
                         f"**The rank `{per_rank}` is not lower than "
                         "the taxon rank: `{taxon.rank}`.**"
                     )
-                short_description = p.plural(_per_rank).capitalize()
+                short_description = inflect_engine().plural(_per_rank).capitalize()
                 _children = [
                     child for child in _taxon_list if child.rank_level == rank_level
                 ]
@@ -324,7 +324,7 @@ class Commands:
                     if _descendants.count() > 2500:
                         short_description = "Children"
                         msg = (
-                            f"\N{WARNING SIGN}  **Too many {p.plural(_per_rank)}. "
+                            f"\N{WARNING SIGN}  **Too many {inflect_engine().plural(_per_rank)}. "
                             "Listing children instead:**"
                         )
                         _per_rank = "child"
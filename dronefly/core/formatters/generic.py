@@ -4,6 +4,8 @@ Anything more complicated than plain text can be rendered in Markdown,
 which is then fairly easy to render to other formats as needed.
 """
 from __future__ import annotations
+from collections import Counter, deque
+from collections.abc import Sequence
 import copy
 from datetime import datetime as dt
 import functools
@@ -15,7 +17,6 @@ if TYPE_CHECKING:
     from dronefly.core.query.query import QueryResponse
 
 import html2markdown
-import inflect
 from pyinaturalist import (
     ConservationStatus,
     EstablishmentMeans,
@@ -55,8 +56,29 @@ MEANS_LABEL_EMOJI = {
     "native": "\N{LARGE GREEN SQUARE}",
     "introduced": "\N{UP-POINTING SMALL RED TRIANGLE}",
 }
+# Emoji followed by a narrow no-break space, ready to prefix a description:
+MEANS_LABEL_EMOJI_NBSP = {
+    label: emoji + "\u202f" for label, emoji in MEANS_LABEL_EMOJI.items()
+}
+
+TAXON_LIST_DELIMITER = (", ", " > ")
+
+_TITLE_SEP = "\n"
+_ANCESTORS_SEP = " in: "
 
-TAXON_LIST_DELIMITER = [", ", " > "]
+_SPECIES_LEVEL = RANK_LEVELS["species"]
+_PRIMARY_RANKS = frozenset(TAXON_PRIMARY_RANKS)
+
+# Per-rank formatting of names: (italicize, primary, terminal)
+# - see format_taxon_name() for the rules these implement
+_FORMAT_BY_RANK = {
+    rank: (
+        rank == "genus" or level <= _SPECIES_LEVEL,
+        rank in _PRIMARY_RANKS,
+        level <= _SPECIES_LEVEL,
+    )
+    for rank, level in RANK_LEVELS.items()
+}
 
 # TODO: the seed idea here is to act on & render spoilered commands and displays,
 #   e.g. `,obs my ||gory observation taxon||`
@@ -74,11 +96,30 @@ _MARKDOWN_ESCAPE_REGEX = re.compile(
 )
 _URL_REGEX = r"(?P<url><[^: >]+:\/[^ >]+>|(?:https?|steam):\/\/[^\s<]+[^<.,:;\"\'\]\s])"
 _MARKDOWN_STOCK_REGEX = rf"(?P<markdown>[_\\~|\*`]|{_MARKDOWN_ESCAPE_COMMON})"
+_DIGIT_RE = re.compile(r"[0-9]")
 
-p = inflect.engine()
-p.defnoun("phylum", "phyla")
-p.defnoun("subphylum", "subphyla")
-p.defnoun("subgenus", "subgenera")
+_p = None
+
+
+def inflect_engine():
+    """Return the shared inflect engine, creating it on first use."""
+    global _p
+    if _p is None:
+        import inflect
+
+        _p = inflect.engine()
+        _p.defnoun("phylum", "phyla")
+        _p.defnoun("subphylum", "subphyla")
+        _p.defnoun("subgenus", "subgenera")
+    return _p
+
+
+def __getattr__(name: str):
+    # `p` is still importable from here, but the engine is only created
+    # when it is first needed.
+    if name == "p":
+        return inflect_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def protect_leading_blanks(text: str = ""):
@@ -135,13 +176,21 @@ def escape_markdown(
 def _sort_rank_name(order):
     """Generate a sort key in `order` by rank and name."""
 
-    def reverse_taxon_name(taxon):
-        reverse_key = functools.cmp_to_key(lambda a, b: (a < b) - (a > b))
-        return reverse_key(taxon.name)
+    if order == "desc":
 
-    def sort_key(taxon):
-        taxon_name_key = reverse_taxon_name(taxon) if order == "desc" else taxon.name
-        return (taxon.rank_level or 0) * -1, taxon_name_key
+        def sort_key(taxon):
+            # Negated code points sort the name in reverse; the trailing 1
+            # sorts after any code point so that longer names sharing a
+            # prefix come first, e.g. "Aba" before "Ab".
+            return (
+                (taxon.rank_level or 0) * -1,
+                (*(-ord(char) for char in taxon.name), 1),
+            )
+
+    else:
+
+        def sort_key(taxon):
+            return (taxon.rank_level or 0) * -1, taxon.name
 
     return sort_key
 
@@ -149,12 +198,12 @@ def _sort_rank_name(order):
 def _sort_rank_obs_name(order):
     """Generate a sort key in `order` by rank, descendant obs count, and name."""
 
+    _order = 1 if order == "asc" else -1
+
     def sort_key(taxon):
-        _order = 1 if order == "asc" else -1
-        if getattr(taxon, "descendant_obs_count", None):
-            obs_count = taxon.descendant_obs_count
-        else:
-            obs_count = taxon.observations_count
+        obs_count = (
+            getattr(taxon, "descendant_obs_count", None) or taxon.observations_count
+        )
         return (
             (taxon.rank_level or 0) * -1,
             obs_count * _order,
@@ -164,6 +213,34 @@ def _sort_rank_obs_name(order):
     return sort_key
 
 
+def _iter_tree(root: Taxon, hide_root: bool = False, max_depth: int = 0):
+    """Generate taxa in a tree depth-first, like Taxon.flatten(), without recursion.
+
+    As with flatten(), each taxon's indent_level is set to its depth in the
+    tree, and an artificial root is skipped when hide_root=True. If max_depth
+    is given, subtrees below that depth from the root are skipped entirely.
+    """
+    # make_tree() in pyinaturalist 0.20.x flags the root it returns (either
+    # the only top-level taxon or an inserted "Life" root) with the private
+    # _artificial attribute, which flatten(hide_root=True) checks. Treat the
+    # root as real if a later pyinaturalist drops the attribute:
+    artificial_root = getattr(root, "_artificial", False)
+    root_level = -1 if hide_root and artificial_root else 0
+    stack = deque([(root, root_level)])
+    while stack:
+        taxon, level = stack.popleft()
+        taxon.indent_level = level
+        if level >= 0:
+            yield taxon
+        if not max_depth or level - root_level < max_depth:
+            stack.extendleft((child, level + 1) for child in reversed(taxon.children))
+
+
+def _sort_key(sort_by: str, order: str):
+    """Generate a sort key for `sort_by` in `order`."""
+    return _sort_rank_obs_name(order) if sort_by == "obs" else _sort_rank_name(order)
+
+
 def taxa_per_rank(
     taxon_list: list[Union[Taxon, TaxonCount]],
     ranks_to_count: Union[list[str], str],
@@ -189,24 +266,41 @@ def taxa_per_rank(
             # filter out any taxa that aren't children. moving support for max_depth
             # into
             include_ranks = included_ranks("any")
+            if root_taxon_id:
+                # Only the root and its direct children are needed, so don't
+                # make a tree of all of the other taxa just to discard them:
+                pruned_taxa = [
+                    taxon
+                    for taxon in taxon_list
+                    if taxon.id == root_taxon_id or taxon.parent_id == root_taxon_id
+                ]
+                if any(taxon.id == root_taxon_id for taxon in pruned_taxa):
+                    taxon_list = pruned_taxa
         else:
             # single rank case:
             include_ranks = [ranks_to_count]
 
-    # generate a sort key that uses the specified order:
-    sort_key = (
-        _sort_rank_obs_name(order) if sort_by == "obs" else _sort_rank_name(order)
-    )
-
     tree = make_tree(
         taxon_list,
         include_ranks=include_ranks,
         root_id=root_taxon_id,
-        sort_key=sort_key,
+        # generate a sort key that uses the specified order:
+        sort_key=_sort_key(sort_by, order),
         # max_depth=max_depth,
     )
+    # Select the test for inclusion once rather than per taxon:
+    predicate = None
     root_taxon = None
-    if max_depth == 1:
+    if include_leaves:
+
+        def is_leaf(taxon):
+            # TODO: determine if the taxon is a leaf some other way if the object
+            # doesn't have both both a direct & descendant count
+            descendant_obs_count = getattr(taxon, "descendant_obs_count", None)
+            return not descendant_obs_count or taxon.count == descendant_obs_count
+
+        predicate = is_leaf
+    elif max_depth == 1:
         if root_taxon_id:
             root_taxon = next(
                 (taxon for taxon in taxon_list if taxon.id == root_taxon_id),
@@ -214,22 +308,29 @@ def taxa_per_rank(
             )
         else:
             root_taxon = taxon_list[0]
+        root_id = root_taxon.id
+
+        def is_child(taxon):
+            ancestors = getattr(taxon, "ancestors", None)
+            if ancestors:
+                return ancestors[-1].id == root_id
+            ancestor_ids = taxon.ancestor_ids
+            return bool(ancestor_ids) and ancestor_ids[-1] == root_id
+
+        predicate = is_child
+
     hide_root = tree.id == ROOT_TAXON_ID or include_ranks and len(include_ranks) == 1
-    for taxon in tree.flatten(hide_root=hide_root):
-        included = True
-        # TODO: determine if the taxon is a leaf some other way if the object
-        # doesn't have both both a direct & descendant count
-        if include_leaves and getattr(taxon, "descendant_obs_count", None):
-            included = taxon.count == taxon.descendant_obs_count
-        elif max_depth == 1:
-            if getattr(taxon, "ancestors", None):
-                included = taxon.ancestors and taxon.ancestors[-1].id == root_taxon.id
-            else:
-                included = (
-                    taxon.ancestor_ids and taxon.ancestor_ids[-1] == root_taxon.id
-                )
-        if included:
-            yield taxon
+    # Children of the root taxon can't be any deeper than this in the tree,
+    # so their descendants are never visited:
+    taxa = _iter_tree(
+        tree,
+        hide_root=hide_root,
+        max_depth=max_depth if root_taxon and tree.id == root_taxon.id else 0,
+    )
+    if predicate is None:
+        yield from taxa
+    else:
+        yield from filter(predicate, taxa)
 
 
 def format_datetime(time, compact=False):
@@ -253,14 +354,25 @@ def format_datetime(time, compact=False):
     return formatted_time
 
 
-def included_ranks(per_rank: str):
+@functools.lru_cache(maxsize=None)
+def _included_ranks(per_rank: str):
     if per_rank == "main":
         ranks = []
         for rank in COMMON_RANKS:
             ranks += RANKS_FOR_LEVEL[RANK_LEVELS[rank]]
     else:
         ranks = [key for key in RANK_LEVELS.keys() if key != "stateofmatter"]
-    return ranks
+    return tuple(ranks)
+
+
+def included_ranks(per_rank: str):
+    # Return a copy so callers are free to modify it.
+    return list(_included_ranks(per_rank))
+
+
+@functools.lru_cache(maxsize=None)
+def _plural_noun(noun: str):
+    return inflect_engine().plural_noun(noun)
 
 
 def filter_taxon_list(
@@ -306,54 +418,55 @@ def filter_taxon_list(
         if isinstance(per_rank, str):
             _per_rank = [per_rank]
         per_rank = []
+        seen = set()
         for _rank in _per_rank:
-            rank = RANK_EQUIVALENTS[_rank] if _rank in RANK_EQUIVALENTS else _rank
-            rank_name = p.plural_noun(RANK_LEVEL_NAMES[RANK_LEVELS[_rank]])
+            rank = RANK_EQUIVALENTS.get(_rank, _rank)
             # Add all ranks at the same level to the filter, described as
             # the most commonly used rank at that level,
             # - e.g. "genus" =>
             #   per_rank = ["genus", "genushybrid"]
             #   described as "genera"
-            if rank not in per_rank:
-                per_rank += RANKS_FOR_LEVEL[RANK_LEVELS[_rank]]
-                _ranks.append(rank_name)
+            if rank not in seen:
+                rank_level = RANK_LEVELS[_rank]
+                level_ranks = RANKS_FOR_LEVEL[rank_level]
+                per_rank += level_ranks
+                seen.update(level_ranks)
+                _ranks.append(_plural_noun(RANK_LEVEL_NAMES[rank_level]))
         # List of arbitrary ranks (e.g. "subfamily/species"):
         ranks = "/".join(_ranks)
         generate_taxa = taxa_per_rank(
             taxon_list, per_rank, root_taxon_id, sort_by, order
         )
-    counted_taxa = []
-    counted_taxon_ids = []
-    tot = {}
-    max_taxon_count_digits = 1
-    max_direct_count_digits = 1
-    for _taxon in generate_taxa:
-        counted_taxon_ids.append(_taxon.id)
-        if getattr(_taxon, "descendant_obs_count", None):
-            taxon_count_digits = len(str(_taxon.descendant_obs_count))
-            direct_count_digits = len(str(_taxon.count))
-            if direct_count_digits > max_direct_count_digits:
-                max_direct_count_digits = direct_count_digits
-            if taxon_count_digits > max_taxon_count_digits:
-                max_taxon_count_digits = taxon_count_digits
+    counted_taxa = list(generate_taxa)
+    counted_taxon_ids = [_taxon.id for _taxon in counted_taxa]
+    tot = Counter(_taxon.rank for _taxon in counted_taxa)
+    # Track the largest counts; their widths are only needed once at the end:
+    max_taxon_count = 0
+    max_direct_count = 0
+    for _taxon in counted_taxa:
+        descendant_obs_count = getattr(_taxon, "descendant_obs_count", None)
+        if descendant_obs_count:
+            if descendant_obs_count > max_taxon_count:
+                max_taxon_count = descendant_obs_count
+            direct_count = _taxon.count
+            if direct_count > max_direct_count:
+                max_direct_count = direct_count
         else:
-            taxon_count_digits = len(str(_taxon.observations_count))
-            if taxon_count_digits > max_taxon_count_digits:
-                max_taxon_count_digits = taxon_count_digits
-        counted_taxa.append(_taxon)
-        rank = _taxon.rank
-        tot[rank] = tot.get(_taxon.rank, 0) + 1
+            observations_count = _taxon.observations_count or 0
+            if observations_count > max_taxon_count:
+                max_taxon_count = observations_count
+    max_taxon_count_digits = len(str(max_taxon_count))
+    max_direct_count_digits = len(str(max_direct_count))
     max_rank_digits = len(str(max(tot.values()))) if tot else 1
     rank_totals = {
-        rank: f"`{str(tot[rank]).rjust(max_rank_digits)}` {p.plural_noun(rank, tot[rank])}"
-        for rank in tot
+        rank: f"`{str(count).rjust(max_rank_digits)}` "
+        + (rank if count == 1 else _plural_noun(rank))
+        for rank, count in tot.items()
     }
-    if per_rank in ("leaf", "child"):
-        # generate a sort key that uses the specified order:
-        sort_key = (
-            _sort_rank_obs_name(order) if sort_by == "obs" else _sort_rank_name(order)
-        )
-        counted_taxa.sort(key=sort_key)
+    if per_rank == "leaf":
+        # Leaves come from different branches of the tree, so sort them all
+        # together. Child taxa are all siblings, already sorted by make_tree().
+        counted_taxa.sort(key=_sort_key(sort_by, order))
     return (
         counted_taxa,
         counted_taxon_ids,
@@ -406,6 +519,10 @@ def format_taxon_establishment_means(
     means: Union[EstablishmentMeans, ListedTaxon],
     all_means: bool = False,
     list_title: bool = False,
+    *,
+    _means_label_desc=MEANS_LABEL_DESC,
+    _means_label_emoji_nbsp=MEANS_LABEL_EMOJI_NBSP,
+    _www_base_url=WWW_BASE_URL,
 ):
     """Format the estalishment means for a taxon for a given place.
 
@@ -425,18 +542,15 @@ def format_taxon_establishment_means(
         and link to establishment means on the web.
     """
     label = means.establishment_means
-    description = MEANS_LABEL_DESC.get(label)
+    description = _means_label_desc.get(label)
     if description is None:
         if not all_means:
             return None
         full_description = f"Establishment means {label} in {means.place.display_name}"
     else:
         full_description = f"{description} {means.place.display_name}"
-    try:
-        emoji = MEANS_LABEL_EMOJI[means.establishment_means] + "\u202f"
-    except KeyError:
-        emoji = ""
-    url = f"{WWW_BASE_URL}/listed_taxa/{means.id}"
+    emoji = _means_label_emoji_nbsp.get(label, "")
+    url = f"{_www_base_url}/listed_taxa/{means.id}"
     if list_title and isinstance(means, ListedTaxon) and means.list.title:
         _means = f"{emoji}{full_description} {format_link(means.list.title, url)}"
     else:
@@ -474,12 +588,17 @@ def format_taxon_conservation_status(
         linked_status = format_link(description, status.url)
         if inflect:
             # inflect statuses with single digits in them correctly
-            first_word = re.sub(
-                r"[0-9]",
-                " {0} ".format(p.number_to_words(r"\1")),
-                description,
-            ).split()[0]
-            article = p.a(first_word).split()[0]
+            engine = inflect_engine()
+            if _DIGIT_RE.search(description):
+                # Only the first digit can affect the first word:
+                first_word = _DIGIT_RE.sub(
+                    " {0} ".format(engine.number_to_words(r"\1")),
+                    description,
+                    count=1,
+                ).split(None, 1)[0]
+            else:
+                first_word = description.split(None, 1)[0]
+            article = engine.a(first_word).split()[0]
             full_description = " ".join((article, linked_status))
         else:
             full_description = linked_status
@@ -497,6 +616,8 @@ def format_taxon_names(
     max_len=0,
     hierarchy=False,
     lang=None,
+    *,
+    _delimiters=TAXON_LIST_DELIMITER,
 ):
     """Format names of taxa from matched records.
 
@@ -528,43 +649,77 @@ def format_taxon_names(
         A delimited list of formatted taxon names.
     """
 
-    delimiter = TAXON_LIST_DELIMITER[int(hierarchy)]
+    if not isinstance(taxa, Sequence):
+        taxa = list(taxa)
+    if not taxa:
+        return names_format % ""
+
+    delimiter = _delimiters[int(hierarchy)]
 
-    names = [
-        format_taxon_name(taxon, with_term=with_term, hierarchy=hierarchy, lang=lang)
-        for taxon in taxa
-    ]
+    # Names are formatted as they are consumed so that when max_len is
+    # given, names that don't fit are never formatted.
+    if hierarchy and not with_term:
+        # Common names are never shown in this case, so lang doesn't apply.
+        names = (
+            _format_taxon_name_cached(
+                taxon.name, taxon.rank, None, taxon.is_active, True, True
+            )
+            for taxon in taxa
+        )
+    else:
+        _format_taxon_name = format_taxon_name
+        names = (
+            _format_taxon_name(
+                taxon, with_term=with_term, hierarchy=hierarchy, lang=lang
+            )
+            for taxon in taxa
+        )
 
     def fit_names(names):
         names_fit = []
         # Account for space already used by format string (minus 2 for %s)
         available_len = max_len - (len(names_format) - 2)
+        delimiter_len = len(delimiter)
+        # Length of names_fit so far, each name followed by a delimiter:
+        fit_len = 0
 
         def more(count):
             return "and %d more" % count
 
-        def formatted_len(name):
-            return sum(len(item) + len(delimiter) for item in names_fit) + len(name)
-
         def overflow(name):
-            return formatted_len(name) > available_len
+            return fit_len + len(name) > available_len
 
         for name in names:
             if overflow(name):
-                unprocessed = len(names) - len(names_fit)
+                unprocessed = len(taxa) - len(names_fit)
                 while overflow(more(unprocessed)):
                     unprocessed += 1
-                    del names_fit[-1]
+                    fit_len -= len(names_fit.pop()) + delimiter_len
                 names_fit.append(more(unprocessed))
                 break
             else:
                 names_fit.append(name)
+                fit_len += len(name) + delimiter_len
         return names_fit
 
-    if max_len:
-        names = fit_names(names)
-
-    return names_format % delimiter.join(names)
+    if len(taxa) == 1 and not max_len:
+        # Nothing to delimit or fit:
+        joined = next(names)
+    else:
+        if max_len:
+            names = fit_names(names)
+        joined = delimiter.join(names)
+    return joined if names_format == "%s" else names_format % joined
+
+
+def _common_name_for_locale(taxon: Taxon, lang: Optional[str]):
+    """Return the first of the taxon's names in the lang locale, if any."""
+    names = taxon.names
+    if not (lang and names):
+        return None
+    return next(
+        (name.get("name") for name in names if name.get("locale", "") == lang), None
+    )
 
 
 def format_taxon_name(
@@ -574,6 +729,8 @@ def format_taxon_name(
     with_rank=True,
     with_common=True,
     lang=None,
+    *,
+    _preferred_common=None,
 ):
     """Format taxon name.
 
@@ -609,58 +766,76 @@ def format_taxon_name(
         name (e.g. "Anser anser domesticus" -> "*Anser anser* var. *domesticus*")
     """
 
+    name = taxon.name
+
     def get_common_name():
-        preferred_common_name = None
-        if lang and taxon.names:
-            name = next(
-                iter([name for name in taxon.names if name.get("locale") == lang]), None
-            )
-            if name:
-                preferred_common_name = name.get("name")
-        if not preferred_common_name:
-            preferred_common_name = taxon.preferred_common_name
+        if hierarchy and not with_term:
+            return None
+        preferred_common_name = (
+            _preferred_common
+            or _common_name_for_locale(taxon, lang)
+            or taxon.preferred_common_name
+        )
         if with_term:
-            common = (
-                taxon.matched_term
-                if taxon.matched_term not in (None, taxon.name, preferred_common_name)
-                else preferred_common_name
-            )
-        else:
-            if hierarchy:
-                common = None
-            else:
-                common = preferred_common_name
-        return common
+            matched_term = taxon.matched_term
+            if matched_term not in (None, name, preferred_common_name):
+                return matched_term
+        return preferred_common_name
 
     common = get_common_name() if with_common else None
-    name = taxon.name
+    return _format_taxon_name_cached(
+        name, taxon.rank, common, taxon.is_active, hierarchy, with_rank
+    )
 
-    rank = taxon.rank
-    rank_level = RANK_LEVELS[rank]
+
+@functools.lru_cache(maxsize=4096)
+def _format_taxon_name_cached(
+    name: str,
+    rank: str,
+    common: Optional[str],
+    is_active: Optional[bool],
+    hierarchy: bool,
+    with_rank: bool,
+    *,
+    _format_by_rank=_FORMAT_BY_RANK,
+    _trinomial_abbr=TRINOMIAL_ABBR,
+):
+    """Format taxon name from its parts. See format_taxon_name() for details.
+
+    Taxon names are formatted repeatedly (e.g. the same ancestors on every
+    page of a taxon display), so results are cached by these parts alone.
+    """
+    italicize, primary, terminal = _format_by_rank[rank]
 
     # Note: We follow how iNat uses italics taxon names on the website, i.e. we:
     # - don't apply italics to the name when it is rank Genushybrid or Subgenus
     # - do italicize the name for Genus and every rank at species or below
     # - any abbreviated english keywords within italicized intraspecific ranks
     #   are not italicized (spp. var. f.)
-    if rank == "genus" or rank_level <= RANK_LEVELS["species"]:
-        name = f"*{name}*"
-    if rank_level > RANK_LEVELS["species"]:
+    italic = "*" if italicize else ""
+    prefix = suffix = ""
+    if not terminal:
         if hierarchy:
-            bold = ("\n> **", "**") if rank in TAXON_PRIMARY_RANKS else ("", "")
-            name = f"{bold[0]}{name}{bold[1]}"
+            if primary:
+                prefix, suffix = "\n> **", "**"
         elif with_rank:
-            name = f"{rank.capitalize()} {name}"
-    else:
-        if rank in TRINOMIAL_ABBR:
-            tri = name.split(" ")
-            if len(tri) == 3:
-                # Note: name already italicized, so close/reopen italics around insertion.
-                name = f"{tri[0]} {tri[1]}* {TRINOMIAL_ABBR[rank]} *{tri[2]}"
-    full_name = f"{name} ({common})" if common else name
-    if not taxon.is_active:
-        full_name += " \N{HEAVY EXCLAMATION MARK SYMBOL} Inactive Taxon"
-    return full_name
+            prefix = f"{rank.capitalize()} "
+    elif rank in _trinomial_abbr and name.count(" ") == 2:
+        # Close/reopen italics around the abbreviation inserted before the
+        # last name:
+        last_space = name.rfind(" ")
+        name = f"{name[:last_space]}* {_trinomial_abbr[rank]} *{name[last_space + 1:]}"
+    return "".join(
+        (
+            prefix,
+            italic,
+            name,
+            italic,
+            suffix,
+            f" ({common})" if common else "",
+            "" if is_active else " \N{HEAVY EXCLAMATION MARK SYMBOL} Inactive Taxon",
+        )
+    )
 
 
 def _full_means(taxon: Taxon):
@@ -678,11 +853,14 @@ def _full_means(taxon: Taxon):
         )
 
 
-def format_quality_grade(options: dict = {}):
+def format_quality_grade(options: Optional[dict] = None):
     """Format as markdown a list of adjectives for quality grade options."""
+    options = options or {}
     adjectives = []
-    quality_grade = (options.get("quality_grade") or "").split(",")
+    quality_grade = set((options.get("quality_grade") or "").split(","))
     verifiable = options.get("verifiable")
+    research = False
+    needsid = False
     if "any" not in quality_grade:
         research = "research" in quality_grade
         needsid = "needs_id" in quality_grade
@@ -824,14 +1002,12 @@ class TaxonListFormatter(ListFormatter):
         self.sort_by = sort_by
         self.order = order
         self.short_description = short_description
-        (
-            self.taxa,
-            self.taxon_ids,
-            self.ranks,
-            self.rank_totals,
-            self.count_digits,
-            self.direct_digits,
-        ) = filter_taxon_list(
+
+    @functools.cached_property
+    def _filtered(self):
+        # Filtering is deferred until the results are first needed, as a
+        # formatter may be discarded before any of it is displayed.
+        return filter_taxon_list(
             self.taxon_list,
             self.per_rank,
             self.query_response.taxon,
@@ -840,6 +1016,30 @@ class TaxonListFormatter(ListFormatter):
             self.order,
         )
 
+    @property
+    def taxa(self):
+        return self._filtered[0]
+
+    @property
+    def taxon_ids(self):
+        return self._filtered[1]
+
+    @property
+    def ranks(self):
+        return self._filtered[2]
+
+    @property
+    def rank_totals(self):
+        return self._filtered[3]
+
+    @property
+    def count_digits(self):
+        return self._filtered[4]
+
+    @property
+    def direct_digits(self):
+        return self._filtered[5]
+
     def format(
         self, with_title: bool = True, page: int = 0, selected: Optional[int] = None
     ):
@@ -895,7 +1095,7 @@ class TaxonListFormatter(ListFormatter):
                 if ancestors[0].id == ROOT_TAXON_ID:
                     del ancestors[0]
                 if ancestors:
-                    header_ranks = included_ranks(self.per_rank)
+                    header_ranks = _included_ranks(self.per_rank)
                     header_names = [
                         format_taxon_name(parent, with_rank=False)
                         for parent in ancestors
@@ -919,8 +1119,9 @@ class TaxonListFormatter(ListFormatter):
                 taxon_count = 0
                 formatted_count = ""
                 formatted_direct = ""
-                if getattr(taxon, "descendant_obs_count", None):
-                    taxon_count = taxon.descendant_obs_count
+                descendant_obs_count = getattr(taxon, "descendant_obs_count", None)
+                if descendant_obs_count:
+                    taxon_count = descendant_obs_count
                     # Format the direct column similarly to Dynamic Life Lists on
                     # iNat web, i.e.
                     # - never show direct count on non-leaves when it is zero
@@ -934,8 +1135,8 @@ class TaxonListFormatter(ListFormatter):
                             formatted_direct = f"({taxon.count})".rjust(
                                 self.direct_digits + 2
                             )
-                            is_leaf = taxon.count == taxon.descendant_obs_count
-                            terminal_rank = taxon.rank_level <= RANK_LEVELS["species"]
+                            is_leaf = taxon.count == descendant_obs_count
+                            terminal_rank = taxon.rank_level <= _SPECIES_LEVEL
                             if is_leaf:
                                 if terminal_rank:
                                     formatted_direct = " " * (self.direct_digits + 2)
@@ -1096,18 +1297,20 @@ class TaxonFormatter(BaseFormatter):
         with_ancestors: bool, optional
             When False, omit ancestors
         """
-        description = self.format_taxon_description()
-        if with_title:
-            description = "\n".join([self.format_title(), description])
+        parts = [self.format_title(), _TITLE_SEP] if with_title else []
+        parts.append(self.format_taxon_description())
         if with_ancestors and self.taxon.ancestors:
-            description += " in: " + format_taxon_names(
-                self.taxon.ancestors,
-                hierarchy=True,
-                max_len=self.max_len,
+            parts += (
+                _ANCESTORS_SEP,
+                format_taxon_names(
+                    self.taxon.ancestors,
+                    hierarchy=True,
+                    max_len=self.max_len,
+                ),
             )
         else:
-            description += "."
-        return description
+            parts.append(".")
+        return "".join(parts)
 
     def format_title(self):
         """Format taxon title as Discord-like markdown.
@@ -1126,33 +1329,25 @@ class TaxonFormatter(BaseFormatter):
             - "Picoides pubescens" ->
                 "*Dryobates Pubescens* (Downy woodpecker) (~~Picoides Pubescens~~)
         """
-        title = format_taxon_name(self.taxon, lang=self.lang)
-        if self.with_url and self.taxon.url:
-            title = format_link(title, self.taxon.url)
+        taxon = self.taxon
+        preferred_common_name = (
+            _common_name_for_locale(taxon, self.lang) or taxon.preferred_common_name
+        )
+        title = format_taxon_name(
+            taxon, lang=self.lang, _preferred_common=preferred_common_name
+        )
+        url = taxon.url
+        if self.with_url and url:
+            title = format_link(title, url)
         # TODO: Remove workaround for outstanding pyinat issue #448 when it is resolved:
         # - https://github.com/pyinat/pyinaturalist/issues/448
-        matched = self.matched_term or self.taxon.matched_term
-        preferred_common_name = self.taxon.preferred_common_name
-        if self.lang and self.taxon.names:
-            name = next(
-                iter(
-                    [
-                        name
-                        for name in self.taxon.names
-                        if name.get("locale") == self.lang
-                    ]
-                ),
-                None,
-            )
-            if name:
-                preferred_common_name = name.get("name")
-        if matched not in (None, self.taxon.name, preferred_common_name):
-            invalid_names = (
-                [name["name"] for name in self.taxon.names if not name["is_valid"]]
-                if self.taxon.names
-                else []
+        matched = self.matched_term or taxon.matched_term
+        if matched not in (None, taxon.name, preferred_common_name):
+            names = taxon.names
+            is_invalid = bool(names) and any(
+                name["name"] == matched and not name["is_valid"] for name in names
             )
-            if matched in invalid_names:
+            if is_invalid:
                 matched = f"~~{matched}~~"
             title += f" ({matched})"
         return title
@@ -1180,7 +1375,7 @@ class TaxonFormatter(BaseFormatter):
             )
             a_status_rank = f"{a_status} {self.taxon.rank}"
         else:
-            a_status_rank = p.a(self.taxon.rank)
+            a_status_rank = inflect_engine().a(self.taxon.rank)
         return a_status_rank
 
     class ObsCountFormatter(BaseCountFormatter):
@@ -1192,7 +1387,7 @@ class TaxonFormatter(BaseFormatter):
 
         def description(self):
             count = self.link()
-            return f"{count} {p.plural('observation', count)}"
+            return f"{count} {inflect_engine().plural('observation', count)}"
 
         def link(self):
             obs_count = self.count()
@@ -1445,7 +1640,7 @@ class QualifiedTaxonFormatter(TaxonFormatter):
             description = [
                 count_str,
                 *adjectives,
-                p.plural("observation", count),
+                inflect_engine().plural("observation", count),
             ]
             filter = query_without_taxon.obs_query_description(
                 with_adjectives=False
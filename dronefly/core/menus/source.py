@@ -10,7 +10,8 @@ the LICENSE file in the root directory.
 
 import itertools
 import inspect
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from collections.abc import Sequence
 
 
 class PageSource:
@@ -186,6 +187,87 @@ class ListPageSource(PageSource):
             return self.entries[base : base + self.per_page]
 
 
+class LazyListPageSource(PageSource):
+    """A data source for a sequence of pages formatted on demand.
+
+    Unlike :class:`ListPageSource`, no page is formatted until it is
+    requested, and only the most recently requested pages are kept.
+
+    Subclasses must implement the following methods:
+
+    - :meth:`count_pages`
+    - :meth:`format_page_number`
+
+    Parameters
+    ------------
+    cache_size: :class:`int`
+        How many formatted pages to keep.
+    """
+
+    def __init__(self, *, cache_size=8):
+        # Most recently requested pages last:
+        self._formatted_pages = OrderedDict()
+        self._cache_size = cache_size
+
+    def count_pages(self):
+        """An abstract method that returns the number of pages without
+        formatting any of them.
+
+        Subclasses must implement this.
+
+        Returns
+        --------
+        :class:`int`
+            The number of pages.
+        """
+        raise NotImplementedError
+
+    def format_page_number(self, page_number):
+        """An abstract method that formats the page with the given number.
+
+        Subclasses must implement this.
+
+        Parameters
+        -----------
+        page_number: :class:`int`
+            The zero-indexed page number to format.
+
+        Returns
+        ---------
+        Any
+            The formatted page.
+        """
+        raise NotImplementedError
+
+    def is_paginating(self):
+        """:class:`bool`: Whether pagination is required."""
+        return self.count_pages() > 1
+
+    def get_max_pages(self):
+        """:class:`int`: The maximum number of pages."""
+        return self.count_pages()
+
+    async def get_page(self, page_number):
+        """Returns the formatted page, formatting it if it is not cached.
+
+        Returns
+        ---------
+        Any
+            The formatted page.
+        """
+        if not 0 <= page_number < self.count_pages():
+            raise IndexError("Page number out of range.")
+        pages = self._formatted_pages
+        if page_number in pages:
+            pages.move_to_end(page_number)
+            return pages[page_number]
+        page = self.format_page_number(page_number)
+        pages[page_number] = page
+        if len(pages) > self._cache_size:
+            pages.popitem(last=False)
+        return page
+
+
 _GroupByEntry = namedtuple("_GroupByEntry", "key items")
 
 
@@ -211,20 +293,28 @@ class GroupByPageSource(ListPageSource):
     """
 
     def __init__(self, entries, *, key, per_page, sort=True):
-        self.__entries = entries if not sort else sorted(entries, key=key)
+        if not isinstance(entries, Sequence):
+            entries = list(entries)
+        # Compute each key once, both to sort (only if not already in order)
+        # and to group:
+        keys = [key(entry) for entry in entries]
+        if sort and any(a > b for a, b in itertools.pairwise(keys)):
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            entries = [entries[i] for i in order]
+            keys = [keys[i] for i in order]
+        self.__entries = entries
         nested = []
         self.nested_per_page = per_page
-        for k, g in itertools.groupby(self.__entries, key=key):
-            g = list(g)
-            if not g:
-                continue
-            size = len(g)
-
-            # Chunk the nested pages
-            nested.extend(
-                _GroupByEntry(key=k, items=g[i : i + per_page])
-                for i in range(0, size, per_page)
-            )
+        # Group and chunk the nested pages in a single pass, starting a new
+        # page whenever the key changes or the current page is full:
+        group_key = no_group = object()
+        items = []
+        for k, entry in zip(keys, entries):
+            if group_key is no_group or k != group_key or len(items) == per_page:
+                group_key = k
+                items = []
+                nested.append(_GroupByEntry(key=k, items=items))
+            items.append(entry)
 
         super().__init__(nested, per_page=1)
 
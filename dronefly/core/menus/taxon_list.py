@@ -1,11 +1,11 @@
-from .source import ListPageSource
+from .source import LazyListPageSource
 from .menu import BaseMenu
 from ..formatters import TaxonListFormatter
 from ..query import QueryResponse
 from ..utils import lifelists_url_from_query_response
 
 
-class TaxonListSource(ListPageSource):
+class TaxonListSource(LazyListPageSource):
     def __init__(self, taxon_list_formatter: TaxonListFormatter):
         self._taxon_list_formatter = taxon_list_formatter
         self._url = (
@@ -13,12 +13,17 @@ class TaxonListSource(ListPageSource):
             if self.query_response.user
             else None
         )
-        pages = list(page for page in self._taxon_list_formatter.generate_pages())
-        super().__init__(pages, per_page=1)
+        super().__init__()
 
     def is_paginating(self):
         return True
 
+    def count_pages(self):
+        return self.formatter.last_page() + 1
+
+    def format_page_number(self, page_number: int):
+        return self.formatter.format_page(page_number)
+
     @property
     def formatter(self) -> TaxonListFormatter:
         return self._taxon_list_formatter
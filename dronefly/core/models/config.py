@@ -1,4 +1,4 @@
-from attrs import define
+from attrs import define, field
 import tomllib
 from typing import Optional, Union
 
@@ -9,9 +9,14 @@ from ..constants import CONFIG_PATH
 class Config:
     """Public class for Config model."""
 
-    data: dict = {}
+    data: dict = field(factory=dict)
+    # users by their str ids, and by int for ids that are numbers:
+    _users: dict = field(factory=dict)
+    _users_int: dict = field(factory=dict)
 
     def __init__(self, data_str: Optional[str] = None):
+        # attrs provides __attrs_init__ in place of __init__, as we define our own:
+        self.__attrs_init__()
         try:
             self.load(data_str)
         except FileNotFoundError:
@@ -21,14 +26,24 @@ class Config:
 
     def load(self, data_str: Optional[str] = None):
         self.data = {}
+        self._users = {}
+        self._users_int = {}
         if data_str:
             self.data = tomllib.loads(data_str)
         else:
             with open(CONFIG_PATH, "rb") as config_file:
                 self.data = tomllib.load(config_file)
+        self._users = self.data.get("users", {})
+        # Only ids in canonical form, i.e. the same as str() of the int:
+        self._users_int = {
+            int(key): user
+            for key, user in self._users.items()
+            if key.isdecimal() and str(int(key)) == key
+        }
 
     def user(self, user_id: Union[str, int]):
-        try:
-            return self.data["users"][str(user_id)]
-        except KeyError:
-            return None
+        if isinstance(user_id, int):
+            return self._users_int.get(user_id)
+        if isinstance(user_id, str):
+            return self._users.get(user_id)
+        return self._users.get(str(user_id))
@@ -47,7 +47,7 @@ def _detect_terms_phrases_code_id(terms_and_phrases: list):
         elif len(terms[0]) == 4:
             code = terms[0].upper()
         else:
-            mat = re.search(PAT_TAXON_LINK, terms[0])
+            mat = PAT_TAXON_LINK.search(terms[0])
             if mat and mat["taxon_id"]:
                 taxon_id = mat["taxon_id"]
 
@@ -16,18 +16,20 @@ WWW_SUBDOMAINS = [
     "guatamela",
     "taiwan",
 ]
+# - groups are non-capturing, as only the named groups of the patterns
+#   that embed this one are used
 WWW_URL_PAT = (
-    r"https?://((("
+    r"https?://(?:(?:(?:"
     # <partner>.inaturalist.org and the main site [www.]inaturalist.org
     f"{'|'.join(WWW_SUBDOMAINS)}"
     r")\.)?inaturalist\.org"
     # inaturalist.<partner>.<tld>
-    r"|inaturalist\.(ala\.org\.au|laji\.fi|mma\.gob\.cl)"
-    r"|(www\.)?("
+    r"|inaturalist\.(?:ala\.org\.au|laji\.fi|mma\.gob\.cl)"
+    r"|(?:www\.)?(?:"
     # [www.]inaturalist.<tld>
-    r"inaturalist\.(ca|lu|nz|se)"
+    r"inaturalist\.(?:ca|lu|nz|se)"
     # [www.]<partner>.<tld>
-    r"|naturalista\.(mx|uy)"
+    r"|naturalista\.(?:mx|uy)"
     r"|biodiversity4all\.org"
     r"|argentinat\.org"
     r")"
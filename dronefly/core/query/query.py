@@ -1,18 +1,45 @@
 """Naturalist information system query module."""
+import attrs
 from attrs import define
 from dataclasses import dataclass, field
 import datetime as dt
+from functools import cached_property
 import re
+from types import MappingProxyType
 from typing import List, Optional, Union
 
-from dronefly.core.formatters.generic import format_taxon_name, format_user_name
+from dronefly.core.formatters.generic import (
+    format_quality_grade,
+    format_taxon_name,
+    format_user_name,
+)
 from dronefly.core.models.controlled_terms import ControlledTermSelector
 from dronefly.core.parsers.constants import VALID_OBS_OPTS, VALID_OBS_SORT_BY
 from pyinaturalist.models import Place, Project, Taxon, User
 
 
-@define
-class TaxonQuery:
+def _format_term(item):
+    return " ".join(item) if isinstance(item, list) else str(item)
+
+
+class _CachedStr:
+    """Mixin to cache str() of a query in its _query attribute.
+
+    Setting any other attribute clears the cache. Changes made in place to
+    list attributes are not detected, so replace the list instead.
+    """
+
+    # Empty slots keep subclasses defined with attrs slots free of a __dict__:
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        if name != "_query":
+            object.__setattr__(self, "_query", None)
+        object.__setattr__(self, name, value)
+
+
+@define(slots=True)
+class TaxonQuery(_CachedStr):
     """A taxon query composed of terms and/or phrases or a code or taxon_id, filtered by ranks."""
 
     taxon_id: Optional[int] = None
@@ -20,31 +47,20 @@ class TaxonQuery:
     phrases: Optional[List[str]] = None
     ranks: Optional[List[str]] = None
     code: Optional[str] = None
-    _query: Optional[str] = None
-
-    def _add_term(self, item):
-        if item:
-            if isinstance(item, list):
-                formatted_item = " ".join(item)
-            else:
-                formatted_item = str(item)
-            self._query += " " + formatted_item if self._query else formatted_item
+    _query: Optional[str] = attrs.field(default=None, init=False, eq=False, repr=False)
 
     def __str__(self):
-        self._query = ""
-        self._add_term(self.taxon_id)
-        self._add_term(self.terms)
-        # TODO: support mixture of terms and phrases better
-        # - currently all phrases will be rendered unquoted as terms,
-        #   so we lose information that was present in the input
-        # self._add_term(self.phrases)
-        self._add_term(self.ranks)
-        self._add_term(self.code)
+        if self._query is None:
+            # TODO: support mixture of terms and phrases better
+            # - currently all phrases will be rendered unquoted as terms,
+            #   so we lose information that was present in the input
+            terms = (self.taxon_id, self.terms, self.ranks, self.code)
+            self._query = " ".join(_format_term(term) for term in terms if term)
         return self._query
 
 
-@define
-class Query:
+@define(slots=True)
+class Query(_CachedStr):
     """Naturalist information system query.
 
     A naturalist information system query is generally composed of one or more
@@ -133,56 +149,42 @@ class Query:
     added_d1: Optional[List] = None
     added_d2: Optional[List] = None
     added_on: Optional[List] = None
-    _query: Optional[str] = None
-
-    def _add_clause(self, fmt, item):
-        if item:
-            if isinstance(item, list):
-                formatted_item = fmt.format(" ".join(item))
-            else:
-                formatted_item = fmt.format(item)
-            self._query += " " + formatted_item if self._query else formatted_item
+    # Cached clauses following the taxon queries, which have their own cache:
+    _query: Optional[str] = attrs.field(default=None, init=False, eq=False, repr=False)
 
     def __str__(self):
-        self._query = ""
-        if self.main:
-            self._add_clause("{}", str(self.main))
-        if self.ancestor:
-            self._add_clause("in {}", str(self.ancestor))
-        self._add_clause("from {}", self.place)
-        self._add_clause("in prj {}", self.project)
-        self._add_clause("by {}", self.user)
-        self._add_clause("id by {}", self.id_by)
-        self._add_clause("not by {}", self.unobserved_by)
-        self._add_clause("except by {}", self.except_by)
-        self._add_clause("with {}", self.controlled_term)
-        self._add_clause("per {}", self.per)
-        self._add_clause("opt {}", self.options)
-        self._add_clause("since {}", self.obs_d1)
-        self._add_clause("until {}", self.obs_d2)
-        self._add_clause("on {}", self.obs_on)
-        self._add_clause("added since {}", self.added_d1)
-        self._add_clause("added until {}", self.added_d2)
-        self._add_clause("added on {}", self.added_on)
-        if self.sort_by:
-            self._add_clause("sort by {}", self.sort_by)
-        if self.order:
-            self._add_clause("order {}", self.order)
-        return self._query
+        if self._query is None:
+            clauses = (
+                ("from", self.place),
+                ("in prj", self.project),
+                ("by", self.user),
+                ("id by", self.id_by),
+                ("not by", self.unobserved_by),
+                ("except by", self.except_by),
+                ("with", self.controlled_term),
+                ("per", self.per),
+                ("opt", self.options),
+                ("since", self.obs_d1),
+                ("until", self.obs_d2),
+                ("on", self.obs_on),
+                ("added since", self.added_d1),
+                ("added until", self.added_d2),
+                ("added on", self.added_on),
+                ("sort by", self.sort_by),
+                ("order", self.order),
+            )
+            self._query = " ".join(
+                f"{keyword} {_format_term(item)}" for keyword, item in clauses if item
+            )
+        main = str(self.main) if self.main else ""
+        ancestor = str(self.ancestor) if self.ancestor else ""
+        parts = (main, ancestor and f"in {ancestor}", self._query)
+        return " ".join(part for part in parts if part)
 
 
 EMPTY_QUERY = Query()
 
 
-class _Params(dict):
-    def set_from(self, obj: object, attr_name: str, param_name: str = None):
-        """Helper for simple one-to-one attribute to param assignments."""
-        if obj:
-            key = param_name or attr_name
-            value = getattr(obj, attr_name)
-            self[key] = value
-
-
 @dataclass
 class DateSelector:
     """A date selector object."""
@@ -193,6 +195,9 @@ class DateSelector:
     d2: Optional[Union[dt.datetime, str]]
     on: Optional[Union[dt.datetime, str]]
 
+    def __bool__(self):
+        return bool(self.on or self.d1 or self.d2)
+
 
 def has_value(arg):
     """Return true if arg is present and is not the `any` special keyword.
@@ -218,18 +223,21 @@ def has_value(arg):
         return arg.lower() != "any"
 
 
+# - conservatively, only alphanumeric, comma, dash or underscore characters
+#   are accepted in option values so far
+_OPT_VAL_RE = re.compile(r"\A[a-z0-9,_-]*\Z")
+
+
 def _get_options(query_options: list):
     options = {}
     # Accept a limited selection of options:
     # - all of these to date apply only to observations, though others could
     #   be added later
     # - all options and values are lowercased
-    for (key, *val) in map(lambda opt: opt.lower().split("="), query_options):
+    for (key, *val) in (opt.lower().split("=", 1) for opt in query_options):
         val = val[0] if val else "true"
-        # - conservatively, only alphanumeric, comma, dash or
-        #   underscore characters accepted in values so far
         # - TODO: proper validation per field type
-        if key in VALID_OBS_OPTS and re.match(r"^[a-z0-9,_-]*$", val):
+        if key in VALID_OBS_OPTS and _OPT_VAL_RE.match(val):
             options[key] = val
     return options
 
@@ -252,6 +260,58 @@ def get_base_query_args(query):
     return args
 
 
+_DATE_FMT = "%b %-d, %Y"
+_TIME_FMT = "%b %-d, %Y %I:%M %p"
+
+
+def _format_date(date: dt.datetime):
+    return date.strftime(_DATE_FMT)
+
+
+def _format_time(time: dt.datetime):
+    return time.strftime(_TIME_FMT)
+
+
+# TODO: support generally; hardwired cases here are for herps, lichenish,
+# seaslugs, and allfish
+_OF_TAXA_DESCRIPTIONS = MappingProxyType(
+    {
+        "20978,26036": "Amphibia, Reptilia (Herps)",
+        ("152028,54743,152030,175541,127378,117881,117869,175246"): (
+            "Lecanoromycetes, Arthoniomycetes, etc. (Lichenized Fungi)"
+        ),
+        (
+            "130687,775798,775804,49784,500752,47113,"
+            "775801,775833,775805,495793,47801,801507"
+        ): (
+            "Nudibranchia, Aplysiida, etc. (Nudibranchs, Sea Hares, "
+            "other marine slugs)"
+        ),
+        "47178,47273,797045,85497": (
+            "Actinopterygii, Agnatha, Elasmobranchii, Sarcopterygii (Extant Fish)"
+        ),
+    }
+)
+# TODO: support generally; hardwired cases here are for waspsonly, mothsonly,
+# nonflowering, nonvascular, and inverts
+_WITHOUT_TAXA_DESCRIPTIONS = MappingProxyType(
+    {
+        "47336,630955": "Formicidae, Anthophila",
+        "47224": "Papilionoidea",
+        "47125": "Angiospermae",
+        "211194": "Tracheophyta",
+        "355675": "Vertebrata",
+    }
+)
+# Note: "without" for each of these taxa are intentionally omitted from the
+# "lichenish" description to keep it from being needlessly wordy.
+_WITHOUT_TAXA_UNDESCRIBED = frozenset({"372831,1040687,1040689,352459"})
+
+
+# obs_args params for entities that allow observations with verifiable=any:
+_ANY_VERIFIABLE_KEYS = frozenset({"project_id", "user_id", "ident_user_id"})
+
+
 @dataclass
 class QueryResponse:
     """A generic query response object.
@@ -287,43 +347,48 @@ class QueryResponse:
     added: Optional[DateSelector] = None
     sort_by: Optional[str] = None
     order: Optional[str] = None
-    adjectives: Optional[List[str]] = field(init=False)
-
-    def __post_init__(self):
-        adjectives = []
-        if self.options:
-            quality_grade = (self.options.get("quality_grade") or "").split(",")
-            verifiable = self.options.get("verifiable")
-            if "any" not in quality_grade:
-                research = "research" in quality_grade
-                needsid = "needs_id" in quality_grade
-            # If specified, will override any quality_grade set already:
-            if verifiable:
-                if verifiable in ["true", ""]:
-                    research = True
-                    needsid = True
-            if verifiable == "false":
-                adjectives.append("*not Verifiable*")
-            elif research and needsid:
-                adjectives.append("*Verifiable*")
-            else:
-                if research:
-                    adjectives.append("*Research Grade*")
-                if needsid:
-                    adjectives.append("*Needs ID*")
-        self.adjectives = adjectives
+    _obs_args: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name, value):
+        # Setting any field invalidates the cached obs_args & adjectives:
+        if name != "_obs_args":
+            object.__setattr__(self, "_obs_args", None)
+            self.__dict__.pop("adjectives", None)
+        object.__setattr__(self, name, value)
+
+    @cached_property
+    def adjectives(self) -> List[str]:
+        """Adjectives describing the quality grade options, e.g. *Research Grade*."""
+        return format_quality_grade(self.options) if self.options else []
 
     def obs_args(self):
-        """Arguments for an observations query."""
-
-        kwargs = _Params({"verifiable": "true"})
-        kwargs.set_from(self.taxon, "id", "taxon_id")
-        kwargs.set_from(self.user, "id", "user_id")
-        kwargs.set_from(self.project, "id", "project_id")
-        kwargs.set_from(self.place, "id", "place_id")
-        kwargs.set_from(self.id_by, "id", "ident_user_id")
-        kwargs.set_from(self.unobserved_by, "id", "unobserved_by_user_id")
-        kwargs.set_from(self.except_by, "id", "not_user_id")
+        """Arguments for an observations query.
+
+        The arguments are computed once, and a copy is returned each time so
+        that callers are free to modify it.
+        """
+        if self._obs_args is None:
+            self._obs_args = self._make_obs_args()
+        return dict(self._obs_args)
+
+    def _make_obs_args(self):
+        kwargs = {"verifiable": "true"}
+        # Simple one-to-one entity id to param assignments:
+        kwargs.update(
+            (param, obj.id)
+            for obj, param in (
+                (self.taxon, "taxon_id"),
+                (self.user, "user_id"),
+                (self.project, "project_id"),
+                (self.place, "place_id"),
+                (self.id_by, "ident_user_id"),
+                (self.unobserved_by, "unobserved_by_user_id"),
+                (self.except_by, "not_user_id"),
+            )
+            if obj
+        )
         if self.unobserved_by:
             kwargs["lrank"] = "species"
         if self.controlled_term:
@@ -344,14 +409,10 @@ class QueryResponse:
         # - if these defaults don't work for corner cases, they can be
         #   overridden in the query with: opt verifiable=<value> (i.e.
         #   self.options overrides are applied below)
-        if (
-            kwargs.get("project_id")
-            or kwargs.get("user_id")
-            or kwargs.get("ident_user_id")
-        ):
+        if not _ANY_VERIFIABLE_KEYS.isdisjoint(kwargs):
             kwargs["verifiable"] = "any"
         if self.options:
-            kwargs = {**kwargs, **self.options}
+            kwargs.update(self.options)
         if self.observed:
             if self.observed.on:
                 kwargs["observed_on"] = str(self.observed.on.date())
@@ -377,13 +438,6 @@ class QueryResponse:
     def obs_query_description(self, with_adjectives: bool = True):
         """Description of an observations query."""
 
-        def _format_date(date: str):
-            return date.strftime("%b %-d, %Y")
-
-        def _format_time(time: str):
-            return time.strftime("%b %-d, %Y %h:%m %p")
-
-        message = ""
         of_taxa_description = ""
         without_taxa_description = ""
         if self.taxon:
@@ -399,42 +453,16 @@ class QueryResponse:
                 # Note: if taxon_ids is given with "of" clause (taxon_id), then
                 # taxon_ids is simply ignored, so we don't handle that case here.
                 if taxon_ids and not self.taxon:
-                    # TODO: support generally; hardwired cases here are for herps,
-                    # lichenish, and seaslugs
-                    of_taxa_description = {
-                        "20978,26036": "Amphibia, Reptilia (Herps)",
-                        ("152028,54743,152030,175541,127378,117881,117869,175246"): (
-                            "Lecanoromycetes, Arthoniomycetes, etc. (Lichenized Fungi)"
-                        ),
-                        (
-                            "130687,775798,775804,49784,500752,47113,"
-                            "775801,775833,775805,495793,47801,801507"
-                        ): (
-                            "Nudibranchia, Aplysiida, etc. (Nudibranchs, Sea Hares, "
-                            "other marine slugs)"
-                        ),
-                        "47178,47273,797045,85497": (
-                            "Actinopterygii, Agnatha, Elasmobranchii, Sarcopterygii "
-                            "(Extant Fish)"
-                        ),
-                    }.get(taxon_ids) or "taxon #" + taxon_ids.replace(",", ", ")
-                # Note: "without" for each of these taxa are intentionally
-                # omitted from the "lichenish" description to keep it from
-                # being needlessly wordy.
-                if without_taxon_id and without_taxon_id not in [
-                    "372831,1040687,1040689,352459"
-                ]:
-                    # TODO: support generally; hardwired cases here are for
-                    # waspsonly, mothsonly, lichenish, etc.
-                    without_taxa_description = {
-                        "47336,630955": "Formicidae, Anthophila",
-                        "47224": "Papilionoidea",
-                        "47125": "Angiospermae",
-                        "211194": "Tracheophyta",
-                        "355675": "Vertebrata",
-                    }.get(without_taxon_id) or "taxon #" + without_taxon_id.replace(
-                        ",", ", "
-                    )
+                    of_taxa_description = _OF_TAXA_DESCRIPTIONS.get(
+                        taxon_ids
+                    ) or "taxon #" + taxon_ids.replace(",", ", ")
+                if (
+                    without_taxon_id
+                    and without_taxon_id not in _WITHOUT_TAXA_UNDESCRIBED
+                ):
+                    without_taxa_description = _WITHOUT_TAXA_DESCRIPTIONS.get(
+                        without_taxon_id
+                    ) or "taxon #" + without_taxon_id.replace(",", ", ")
 
         _taxa_description = []
         if of_taxa_description:
@@ -461,85 +489,84 @@ class QueryResponse:
                 _of.append(", ".join(self.adjectives))
             _of.append("taxa")
             _taxa_description.append(" ".join(_of))
-        message += " ".join(_taxa_description)
+        # The other clauses follow the taxa description:
+        parts = _taxa_description
         if self.project:
-            message += " in " + self.project.title
+            parts.append(f"in {self.project.title}")
         elif self.options:
             project_id = self.options.get("project_id")
             if project_id:
-                message += " in project #" + project_id.replace(",", ", ")
+                parts.append("in project #" + project_id.replace(",", ", "))
         if self.place:
-            message += " from " + self.place.display_name
+            parts.append(f"from {self.place.display_name}")
         elif self.options:
             place_id = self.options.get("place_id")
             if place_id:
-                message += " from place #" + place_id.replace(",", ", ")
+                parts.append("from place #" + place_id.replace(",", ", "))
         if self.user:
-            message += " by " + format_user_name(self.user)
+            parts.append(f"by {format_user_name(self.user)}")
         elif self.options:
             user_id = self.options.get("user_id")
             if user_id:
-                message += " by user #" + user_id.replace(",", ", ")
+                parts.append("by user #" + user_id.replace(",", ", "))
         if self.unobserved_by:
-            message += " unobserved by " + format_user_name(self.unobserved_by)
+            parts.append(f"unobserved by {format_user_name(self.unobserved_by)}")
         if self.id_by:
-            message += " identified by " + format_user_name(self.id_by)
+            parts.append(f"identified by {format_user_name(self.id_by)}")
         if self.except_by:
-            message += " except by " + format_user_name(self.except_by)
-        if self.observed and self.observed.on or self.observed.d1 or self.observed.d2:
-            message += " observed "
+            parts.append(f"except by {format_user_name(self.except_by)}")
+        if self.observed:
+            parts.append("observed")
             if self.observed.on:
-                message += f" on {_format_date(self.observed.on)}"
+                parts.append(f"on {_format_date(self.observed.on)}")
             else:
                 if self.observed.d1:
-                    message += f" on or after {_format_date(self.observed.d1)}"
+                    parts.append(f"on or after {_format_date(self.observed.d1)}")
                 if self.observed.d2:
                     if self.observed.d1:
-                        message += " and "
-                    message += f" on or before {_format_date(self.observed.d2)}"
-        if self.added and self.added.on or self.added.d1 or self.added.d2:
-            message += " added "
+                        parts.append("and")
+                    parts.append(f"on or before {_format_date(self.observed.d2)}")
+        if self.added:
+            parts.append("added")
             if self.added.on:
-                message += f" on {_format_date(self.observed.on)}"
+                parts.append(f"on {_format_date(self.added.on)}")
             else:
                 if self.added.d1:
-                    message += f" on or after {_format_time(self.added.d1)}"
+                    parts.append(f"on or after {_format_time(self.added.d1)}")
                 if self.added.d2:
                     if self.added.d1:
-                        message += " and "
-                    message += f" on or before {_format_time(self.added.d2)}"
-        if self.controlled_term:
-            (term, term_value) = self.controlled_term
-            desc = f" with {term.label}"
-            desc += f" {term_value.label}"
-            message += desc
+                        parts.append("and")
+                    parts.append(f"on or before {_format_time(self.added.d2)}")
+        controlled_term = self.controlled_term
+        if controlled_term:
+            parts.append(
+                f"with {controlled_term.term.label} {controlled_term.value.label}"
+            )
         kwargs = self.obs_args()
         hrank = kwargs.get("hrank")
         lrank = kwargs.get("lrank")
         if lrank or hrank:
-            with_or_and = "with" if not self.controlled_term else "and"
+            with_or_and = "with" if not controlled_term else "and"
             if lrank and hrank:
-                message += " {} rank from {} through {}".format(
-                    with_or_and, lrank, hrank
-                )
+                parts.append(f"{with_or_and} rank from {lrank} through {hrank}")
             else:
                 # For some commands "species and higher" filter is added only to
                 # make it match results on the web. Including this in the description
                 # would just be confusing.
                 if lrank != "species":
                     higher_or_lower = "higher" if lrank else "lower"
-                    message += " {} rank {} or {}".format(
-                        with_or_and, hrank or lrank, higher_or_lower
+                    parts.append(
+                        f"{with_or_and} rank {hrank or lrank} or {higher_or_lower}"
                     )
         order_by = kwargs.get("order_by")
         order = kwargs.get("order")
         if order:
             _order = "ascending" if order == "asc" else "descending"
-            message += f" in {_order} order"
+            parts.append(f"in {_order} order")
         if order_by:
             _order_by = str(VALID_OBS_SORT_BY.get(order_by)).replace("_", " ")
             if order:
-                message += f" by `#{_order_by}`"
+                parts.append(f"by `#{_order_by}`")
             else:
-                message += f" ordered by `{_order_by}`"
-        return re.sub(r"^ ", "", message)
+                parts.append(f"ordered by `{_order_by}`")
+        return " ".join(parts)
@@ -1,5 +1,6 @@
+from functools import lru_cache
 from typing import TYPE_CHECKING
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 
 from dronefly.core.formatters.constants import WWW_BASE_URL
 
@@ -7,6 +8,27 @@ if TYPE_CHECKING:
     from dronefly.core.query.query import QueryResponse
 
 
+@lru_cache(maxsize=2048)
+def _url_with_query(url: str, typed_params: tuple):
+    return f"{url}?{urlencode([(key, val) for key, _, val in typed_params])}"
+
+
+def _add_query(url: str, params: dict):
+    """Add params to url as a query string, caching the result if possible."""
+    if len(params) == 1:
+        # Fast path for a single param, e.g. just taxon_id:
+        ((key, value),) = params.items()
+        return f"{url}?{quote_plus(str(key))}={quote_plus(str(value))}"
+    try:
+        # Key on each value's type too, as e.g. True, 1 & 1.0 compare equal
+        # but are encoded differently:
+        typed_params = tuple((key, type(val), val) for key, val in params.items())
+        return _url_with_query(url, typed_params)
+    except TypeError:
+        # Unhashable values, e.g. lists, can't be cached:
+        return f"{url}?{urlencode(params)}"
+
+
 def lifelists_url_from_query_response(query_response: "QueryResponse"):
     """Lifelists url for a user from query_response."""
     user = query_response.user
@@ -22,7 +44,7 @@ def lifelists_url_from_query_response(query_response: "QueryResponse"):
         if (val := obs_args.get(key)) and "," not in str(val)
     }
     if lifelists_obs_args:
-        url += f"?{urlencode(lifelists_obs_args)}"
+        url = _add_query(url, lifelists_obs_args)
     return url
 
 
@@ -31,10 +53,11 @@ def obs_url_from_v1(params: dict):
     url = WWW_BASE_URL + "/observations"
     if params:
         if "observed_on" in params:
-            _params = params.copy()
-            _params["on"] = params["observed_on"]
-            del _params["observed_on"]
+            _params = {
+                ("on" if key == "observed_on" else key): val
+                for key, val in params.items()
+            }
         else:
             _params = params
-        url += "?" + urlencode(_params)
+        url = _add_query(url, _params)
     return url
@@ -0,0 +1,55 @@
+"""Tests for Config."""
+# pylint: disable=missing-class-docstring, no-self-use, missing-function-docstring
+# pylint: disable=redefined-outer-name
+import pytest
+
+from dronefly.core.models.config import Config
+
+
+@pytest.fixture
+def config():
+    return Config('[users.1234]\ninat_user_id = 545640\n[users.inatbot]\nlang = "fr"\n')
+
+
+class TestConfigUser:
+    def test_str_id(self, config):
+        assert config.user("1234") == {"inat_user_id": 545640}
+
+    def test_int_id(self, config):
+        assert config.user(1234) == {"inat_user_id": 545640}
+
+    def test_non_numeric_id(self, config):
+        assert config.user("inatbot") == {"lang": "fr"}
+
+    def test_other_id_type(self, config):
+        class UserId:
+            def __str__(self):
+                return "1234"
+
+        assert config.user(UserId()) == {"inat_user_id": 545640}
+
+    def test_non_canonical_numeric_ids(self):
+        config = Config('[users."0123"]\nlang = "fr"\n[users."²"]\nlang = "de"\n')
+        assert config.user("0123") == {"lang": "fr"}
+        assert config.user(123) is None
+        assert config.user("²") == {"lang": "de"}
+
+    def test_missing(self, config):
+        assert config.user(4321) is None
+
+    def test_no_users(self):
+        assert Config("[other]\n").user(1234) is None
+
+
+class TestConfigLoad:
+    def test_missing_file(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            "dronefly.core.models.config.CONFIG_PATH", tmp_path / "missing.toml"
+        )
+        config = Config()
+        assert config.data == {}
+        assert config.user(1234) is None
+
+    def test_data_not_shared(self):
+        config = Config("[users.1234]\n")
+        assert Config("[other]\n").data is not config.data
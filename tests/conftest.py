@@ -0,0 +1,13 @@
+"""Shared test fixtures."""
+# pylint: disable=missing-function-docstring
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    # One loop for all async tests rather than a new loop per test:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
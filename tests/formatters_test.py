@@ -0,0 +1,325 @@
+"""Tests for generic formatters."""
+# pylint: disable=missing-class-docstring, no-self-use, missing-function-docstring
+# pylint: disable=redefined-outer-name
+import pytest
+from pyinaturalist import ConservationStatus, EstablishmentMeans, Place, Taxon
+
+from dronefly.core.formatters.generic import (
+    TaxonFormatter,
+    format_quality_grade,
+    format_taxon_conservation_status,
+    format_taxon_establishment_means,
+    format_taxon_name,
+    format_taxon_names,
+    filter_taxon_list,
+    taxa_per_rank,
+)
+
+
+@pytest.fixture(scope="module")
+def downy_woodpecker():
+    return Taxon(
+        id=792988,
+        name="Dryobates pubescens",
+        rank="species",
+        preferred_common_name="Downy Woodpecker",
+        is_active=True,
+        names=[
+            {"name": "Picoides pubescens", "is_valid": False, "locale": "sci"},
+            {"name": "Dryobates pubescens", "is_valid": True, "locale": "sci"},
+            {"name": "Pic mineur", "is_valid": True, "locale": "fr"},
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def bird_ancestors():
+    return [
+        Taxon(
+            id=taxon_id,
+            name=name,
+            rank=rank,
+            preferred_common_name=common_name,
+            is_active=True,
+        )
+        for (taxon_id, name, rank, common_name) in (
+            (1, "Animalia", "kingdom", "Animals"),
+            (2, "Chordata", "phylum", "Chordates"),
+            (355675, "Vertebrata", "subphylum", "Vertebrates"),
+        )
+    ]
+
+
+@pytest.fixture(scope="module")
+def birds(bird_ancestors):
+    return Taxon(
+        id=3,
+        name="Aves",
+        rank="class",
+        preferred_common_name="Birds",
+        is_active=True,
+        observations_count=19999999,
+        ancestors=bird_ancestors,
+    )
+
+
+@pytest.fixture(scope="module")
+def life_list_taxa():
+    return [
+        Taxon(id=taxon_id, name=name, rank=rank, parent_id=parent_id)
+        for (taxon_id, name, rank, parent_id) in (
+            (48460, "Life", "stateofmatter", None),
+            (1, "Animalia", "kingdom", 48460),
+            (47126, "Plantae", "kingdom", 48460),
+            (2, "Chordata", "phylum", 1),
+            (47125, "Tracheophyta", "phylum", 47126),
+        )
+    ]
+
+
+class TestTaxaPerRank:
+    def test_treewise_order(self, life_list_taxa):
+        taxa = taxa_per_rank(life_list_taxa, ["kingdom", "phylum"])
+        assert [(taxon.name, taxon.indent_level) for taxon in taxa] == [
+            ("Animalia", 0),
+            ("Chordata", 1),
+            ("Plantae", 0),
+            ("Tracheophyta", 1),
+        ]
+
+    def test_single_rank(self, life_list_taxa):
+        taxa = taxa_per_rank(life_list_taxa, ["phylum"])
+        assert [taxon.name for taxon in taxa] == ["Chordata", "Tracheophyta"]
+
+    def test_order_desc(self, life_list_taxa):
+        taxa = taxa_per_rank(life_list_taxa, ["kingdom", "phylum"], order="desc")
+        assert [taxon.name for taxon in taxa] == [
+            "Plantae",
+            "Tracheophyta",
+            "Animalia",
+            "Chordata",
+        ]
+
+    @pytest.mark.parametrize(
+        "root_taxon_id,expected",
+        [(48460, ["Animalia", "Plantae"]), (1, ["Chordata"]), (2, [])],
+    )
+    def test_child(self, life_list_taxa, root_taxon_id, expected):
+        taxa = taxa_per_rank(life_list_taxa, "child", root_taxon_id)
+        assert [taxon.name for taxon in taxa] == expected
+
+
+class TestFilterTaxonList:
+    def test_arbitrary_ranks(self, life_list_taxa):
+        _, taxon_ids, ranks, *_ = filter_taxon_list(
+            life_list_taxa, ["kingdom", "phylum", "kingdom"], None
+        )
+        assert taxon_ids == [1, 2, 47126, 47125]
+        assert ranks == "kingdoms/phyla"
+
+    @pytest.mark.parametrize(
+        "order,expected",
+        [("asc", ["Animalia", "Plantae"]), ("desc", ["Plantae", "Animalia"])],
+    )
+    def test_child_sorted(self, life_list_taxa, order, expected):
+        taxa, *_ = filter_taxon_list(
+            life_list_taxa, "child", None, root_taxon_id=48460, order=order
+        )
+        assert [taxon.name for taxon in taxa] == expected
+
+    def test_rank_totals(self, life_list_taxa):
+        *_, rank_totals, _, _ = filter_taxon_list(
+            life_list_taxa[:-1], ["kingdom", "phylum"], None
+        )
+        assert rank_totals == {"kingdom": "`2` kingdoms", "phylum": "`1` phylum"}
+
+
+class TestFormatTaxonName:
+    @pytest.mark.parametrize(
+        "name,rank,expected",
+        [
+            ("Aves", "class", "Class Aves"),
+            ("Setophaga", "genus", "Genus *Setophaga*"),
+            ("Setophaga coronata", "species", "*Setophaga coronata*"),
+            (
+                "Setophaga coronata coronata",
+                "subspecies",
+                "*Setophaga coronata* ssp. *coronata*",
+            ),
+            ("Anser anser domesticus", "variety", "*Anser anser* var. *domesticus*"),
+            ("Salix × rubens", "hybrid", "*Salix × rubens*"),
+            ("Aa bb cc dd", "subspecies", "*Aa bb cc dd*"),
+        ],
+    )
+    def test_name_and_rank(self, name, rank, expected):
+        taxon = Taxon(id=1, name=name, rank=rank, is_active=True)
+        assert format_taxon_name(taxon) == expected
+
+    def test_common_name(self, downy_woodpecker):
+        assert format_taxon_name(downy_woodpecker) == (
+            "*Dryobates pubescens* (Downy Woodpecker)"
+        )
+
+    def test_lang(self, downy_woodpecker):
+        assert format_taxon_name(downy_woodpecker, lang="fr") == (
+            "*Dryobates pubescens* (Pic mineur)"
+        )
+
+    def test_cached_by_name_parts(self, downy_woodpecker):
+        formatted = format_taxon_name(downy_woodpecker)
+        assert format_taxon_name(downy_woodpecker) is formatted
+        assert format_taxon_name(downy_woodpecker, lang="fr") != formatted
+
+    def test_inactive(self):
+        taxon = Taxon(id=1, name="Aves", rank="class", is_active=False)
+        assert format_taxon_name(taxon) == (
+            "Class Aves \N{HEAVY EXCLAMATION MARK SYMBOL} Inactive Taxon"
+        )
+
+
+class TestFormatTaxonNames:
+    def test_list(self, bird_ancestors):
+        assert format_taxon_names(bird_ancestors) == (
+            "Kingdom Animalia (Animals), Phylum Chordata (Chordates), "
+            "Subphylum Vertebrata (Vertebrates)"
+        )
+
+    def test_max_len(self, bird_ancestors):
+        assert format_taxon_names(bird_ancestors, max_len=60) == (
+            "Kingdom Animalia (Animals), and 2 more"
+        )
+
+    def test_empty(self):
+        assert format_taxon_names([]) == ""
+
+    @pytest.mark.parametrize(
+        "hierarchy,expected",
+        [(False, "Kingdom Animalia (Animals)"), (True, "\n> **Animalia**")],
+    )
+    def test_single(self, bird_ancestors, hierarchy, expected):
+        assert format_taxon_names(bird_ancestors[:1], hierarchy=hierarchy) == expected
+
+    def test_iterable(self, bird_ancestors):
+        assert format_taxon_names(iter(bird_ancestors), max_len=60) == (
+            "Kingdom Animalia (Animals), and 2 more"
+        )
+
+    def test_names_format(self, bird_ancestors):
+        assert format_taxon_names(bird_ancestors[:1], names_format="in: %s") == (
+            "in: Kingdom Animalia (Animals)"
+        )
+
+    def test_hierarchy(self, bird_ancestors):
+        assert format_taxon_names(bird_ancestors, hierarchy=True) == (
+            "\n> **Animalia** > \n> **Chordata** > Vertebrata"
+        )
+
+
+class TestFormatQualityGrade:
+    def test_no_options(self):
+        assert format_quality_grade() == []
+
+    def test_research(self):
+        assert format_quality_grade({"quality_grade": "research"}) == [
+            "*Research Grade*"
+        ]
+
+    def test_research_and_needs_id(self):
+        assert format_quality_grade({"quality_grade": "research,needs_id"}) == [
+            "*Verifiable*"
+        ]
+
+    def test_any(self):
+        assert format_quality_grade({"quality_grade": "any"}) == []
+
+    def test_any_verifiable(self):
+        assert format_quality_grade(
+            {"quality_grade": "any", "verifiable": "false"}
+        ) == ["*not Verifiable*"]
+
+
+class TestFormatTaxonConservationStatus:
+    @pytest.mark.parametrize(
+        "status,status_name,expected",
+        [
+            ("EN", "endangered", "an [endangered (EN)](https://example.org)"),
+            (
+                "S1",
+                "critically imperiled",
+                "a [critically imperiled (S1)](https://example.org)",
+            ),
+        ],
+    )
+    def test_brief_inflected(self, status, status_name, expected):
+        conservation_status = ConservationStatus(
+            id=1,
+            status=status,
+            status_name=status_name,
+            authority="NatureServe",
+            url="https://example.org",
+        )
+        assert (
+            format_taxon_conservation_status(
+                conservation_status, brief=True, inflect=True
+            )
+            == expected
+        )
+
+
+class TestFormatTaxonEstablishmentMeans:
+    @pytest.fixture
+    def canada(self):
+        return Place(id=6712, display_name="Canada")
+
+    def test_native(self, canada):
+        means = EstablishmentMeans(id=5, establishment_means="native", place=canada)
+        assert format_taxon_establishment_means(means) == (
+            "\N{LARGE GREEN SQUARE}\u202f"
+            "[native in Canada](https://www.inaturalist.org/listed_taxa/5)"
+        )
+
+    def test_unknown(self, canada):
+        means = EstablishmentMeans(id=5, establishment_means="unknown", place=canada)
+        assert format_taxon_establishment_means(means) is None
+        assert format_taxon_establishment_means(means, all_means=True) == (
+            "[Establishment means unknown in Canada]"
+            "(https://www.inaturalist.org/listed_taxa/5)"
+        )
+
+
+class TestTaxonFormatter:
+    def test_format(self, birds):
+        assert TaxonFormatter(birds).format() == (
+            "[Class Aves (Birds)](https://www.inaturalist.org/taxa/3)\nis a class with "
+            "[19,999,999](https://www.inaturalist.org/observations?taxon_id=3) "
+            "observations in: \n> **Animalia** > \n> **Chordata** > Vertebrata"
+        )
+
+    def test_format_without_title_or_ancestors(self, birds):
+        assert TaxonFormatter(birds).format(with_title=False, with_ancestors=False) == (
+            "is a class with "
+            "[19,999,999](https://www.inaturalist.org/observations?taxon_id=3) "
+            "observations."
+        )
+
+    def test_title_invalid_matched_term(self, downy_woodpecker):
+        formatter = TaxonFormatter(
+            downy_woodpecker, with_url=False, matched_term="Picoides pubescens"
+        )
+        assert formatter.format_title() == (
+            "*Dryobates pubescens* (Downy Woodpecker) (~~Picoides pubescens~~)"
+        )
+
+    def test_title_valid_matched_term(self, downy_woodpecker):
+        formatter = TaxonFormatter(
+            downy_woodpecker, with_url=False, matched_term="Downy"
+        )
+        assert formatter.format_title() == (
+            "*Dryobates pubescens* (Downy Woodpecker) (Downy)"
+        )
+
+    def test_title_lang(self, downy_woodpecker):
+        formatter = TaxonFormatter(
+            downy_woodpecker, lang="fr", with_url=False, matched_term="Pic mineur"
+        )
+        assert formatter.format_title() == "*Dryobates pubescens* (Pic mineur)"
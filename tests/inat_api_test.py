@@ -5,6 +5,6 @@ from dronefly.core.clients.inat import iNatClient
 # pylint: disable=missing-function-docstring
 
 
-@pytest.fixture(name="inat_api")
-async def fixture_inat_api():
+@pytest.fixture(name="inat_api", scope="module")
+def fixture_inat_api():
     return iNatClient()
@@ -1,7 +1,26 @@
 """Tests for query module."""
+import copy
 from datetime import datetime
 
-from dronefly.core.query.query import Query, TaxonQuery
+import pytest
+from pyinaturalist import (
+    ControlledTerm,
+    ControlledTermValue,
+    Place,
+    Project,
+    Taxon,
+    User,
+)
+
+from dronefly.core.models.controlled_terms import ControlledTermSelector
+from dronefly.core.query.query import (
+    DateSelector,
+    Query,
+    QueryResponse,
+    TaxonQuery,
+    get_base_query_args,
+    has_value,
+)
 
 
 # pylint: disable=missing-class-docstring disable=no-self-use disable=missing-function-docstring
@@ -113,3 +132,213 @@ class TestQuery:
     def test_query_order(self):
         query = Query(main=TaxonQuery(terms=["birds"]), user="me", order="asc")
         assert str(query) == "birds by me order asc"
+
+    def test_query_str_updated_when_changed(self):
+        query = Query(main=TaxonQuery(terms=["birds"]), user="me")
+        assert str(query) == "birds by me"
+        query.user = "you"
+        query.main.terms = ["bees"]
+        assert str(query) == "bees by you"
+
+    @pytest.mark.parametrize(
+        "cls,kwargs,expected",
+        [(Query, {"user": "me"}, "by me"), (TaxonQuery, {"terms": ["a"]}, "a")],
+    )
+    def test_query_str_cache_not_seeded(self, cls, kwargs, expected):
+        with pytest.raises(TypeError):
+            cls(**kwargs, query="STALE")
+        assert str(cls(**kwargs)) == expected
+
+    def test_query_slots(self):
+        query = Query(main=TaxonQuery(terms=["birds"]))
+        assert not hasattr(query, "__dict__")
+        assert not hasattr(query.main, "__dict__")
+
+    def test_query_eq_after_str(self):
+        query = Query(main=TaxonQuery(terms=["birds"]), user="me")
+        str(query)
+        assert query == Query(main=TaxonQuery(terms=["birds"]), user="me")
+
+
+class TestDateSelector:
+    def test_empty(self):
+        assert not DateSelector(d1=None, d2=None, on=None)
+
+    def test_not_empty(self):
+        assert DateSelector(d1=None, d2=datetime(2023, 1, 2), on=None)
+
+
+class TestHasValue:
+    @pytest.mark.parametrize(
+        "arg,expected",
+        [
+            (None, False),
+            ("", False),
+            ([], False),
+            ("any", False),
+            ("Any", False),
+            ("kueda", True),
+            (["any"], False),
+            (["2023-01-01"], True),
+            (datetime(2023, 1, 1), True),
+            (TaxonQuery(terms=["any"]), False),
+            (TaxonQuery(terms=["birds"]), True),
+            (TaxonQuery(taxon_id=3), True),
+        ],
+    )
+    def test_has_value(self, arg, expected):
+        assert bool(has_value(arg)) is expected
+
+
+class TestGetBaseQueryArgs:
+    def test_options(self):
+        query = Query(
+            options=["Quality_Grade=research", "popular", "taxon_ids=1=2", "foo=bar"]
+        )
+        assert get_base_query_args(query)["options"] == {
+            "quality_grade": "research",
+            "popular": "true",
+        }
+
+
+class TestObsQueryDescription:
+    @pytest.mark.parametrize(
+        "options,expected",
+        [
+            ({"taxon_ids": "20978,26036"}, "of Amphibia, Reptilia (Herps)"),
+            ({"taxon_ids": "1,2"}, "of taxon #1, 2"),
+            ({"without_taxon_id": "47224"}, "of taxa without Papilionoidea"),
+            (
+                {
+                    "taxon_ids": (
+                        "152028,54743,152030,175541,127378,117881,117869,175246"
+                    ),
+                    "without_taxon_id": "372831,1040687,1040689,352459",
+                },
+                "of Lecanoromycetes, Arthoniomycetes, etc. (Lichenized Fungi)",
+            ),
+        ],
+    )
+    def test_taxon_ids(self, options, expected):
+        no_dates = DateSelector(d1=None, d2=None, on=None)
+        query_response = QueryResponse(
+            options=options, observed=no_dates, added=no_dates
+        )
+        assert query_response.obs_query_description() == expected
+
+    def test_observed(self):
+        no_dates = DateSelector(d1=None, d2=None, on=None)
+        observed = DateSelector(
+            d1=datetime(2023, 1, 2), d2=datetime(2023, 2, 3), on=None
+        )
+        query_response = QueryResponse(observed=observed, added=no_dates)
+        assert query_response.obs_query_description() == (
+            "of taxa observed on or after Jan 2, 2023 and on or before Feb 3, 2023"
+        )
+
+    def test_added(self):
+        no_dates = DateSelector(d1=None, d2=None, on=None)
+        added = DateSelector(d1=datetime(2023, 1, 2, 13, 5), d2=None, on=None)
+        query_response = QueryResponse(observed=no_dates, added=added)
+        assert query_response.obs_query_description() == (
+            "of taxa added on or after Jan 2, 2023 01:05 PM"
+        )
+
+    def test_added_on(self):
+        observed = DateSelector(d1=None, d2=None, on=datetime(2023, 1, 2))
+        added = DateSelector(d1=None, d2=None, on=datetime(2023, 2, 3))
+        query_response = QueryResponse(observed=observed, added=added)
+        assert query_response.obs_query_description() == (
+            "of taxa observed on Jan 2, 2023 added on Feb 3, 2023"
+        )
+
+    def test_no_date_selectors(self):
+        assert QueryResponse().obs_query_description() == "of taxa"
+
+    def test_controlled_term(self):
+        no_dates = DateSelector(d1=None, d2=None, on=None)
+        controlled_term = ControlledTermSelector(
+            ControlledTerm(id=9, label="Sex"),
+            ControlledTermValue(id=11, label="Female"),
+        )
+        query_response = QueryResponse(
+            controlled_term=controlled_term, observed=no_dates, added=no_dates
+        )
+        assert query_response.obs_query_description() == "of taxa with Sex Female"
+
+    def test_without_adjectives(self):
+        no_dates = DateSelector(d1=None, d2=None, on=None)
+        query_response = QueryResponse(
+            options={"place_id": "1,2"}, observed=no_dates, added=no_dates
+        )
+        assert query_response.obs_query_description(with_adjectives=False) == (
+            "from place #1, 2"
+        )
+
+
+class TestAdjectives:
+    @pytest.mark.parametrize(
+        "options,expected",
+        [
+            (None, []),
+            ({"quality_grade": "research"}, ["*Research Grade*"]),
+            ({"quality_grade": "any", "verifiable": "true"}, ["*Verifiable*"]),
+            ({"quality_grade": "any", "verifiable": "any"}, []),
+        ],
+    )
+    def test_adjectives(self, options, expected):
+        assert QueryResponse(options=options).adjectives == expected
+
+    def test_adjectives_updated_when_changed(self):
+        query_response = QueryResponse(options={"quality_grade": "research"})
+        assert query_response.adjectives == ["*Research Grade*"]
+        query_response.options = {"quality_grade": "needs_id"}
+        assert query_response.adjectives == ["*Needs ID*"]
+
+
+class TestObsArgs:
+    def test_obs_args(self):
+        query_response = QueryResponse(taxon=Taxon(id=3), options={"popular": "true"})
+        assert query_response.obs_args() == {
+            "verifiable": "true",
+            "taxon_id": 3,
+            "popular": "true",
+        }
+
+    def test_obs_args_entity_ids(self):
+        query_response = QueryResponse(
+            user=User(id=1), except_by=User(id=2), place=Place(id=6712)
+        )
+        assert query_response.obs_args() == {
+            "verifiable": "any",
+            "user_id": 1,
+            "not_user_id": 2,
+            "place_id": 6712,
+        }
+
+    @pytest.mark.parametrize(
+        "entity,model,verifiable",
+        [
+            ("taxon", Taxon, "true"),
+            ("project", Project, "any"),
+            ("user", User, "any"),
+            ("id_by", User, "any"),
+            ("unobserved_by", User, "true"),
+        ],
+    )
+    def test_obs_args_verifiable(self, entity, model, verifiable):
+        query_response = QueryResponse(**{entity: model(id=1)})
+        assert query_response.obs_args()["verifiable"] == verifiable
+
+    def test_obs_args_copy(self):
+        query_response = QueryResponse(taxon=Taxon(id=3))
+        query_response.obs_args()["taxon_id"] = 4
+        assert query_response.obs_args()["taxon_id"] == 3
+
+    def test_obs_args_updated_when_changed(self):
+        query_response = QueryResponse(taxon=Taxon(id=3))
+        assert "taxon_id" in query_response.obs_args()
+        query_without_taxon = copy.copy(query_response)
+        query_without_taxon.taxon = None
+        assert "taxon_id" not in query_without_taxon.obs_args()
+        assert "taxon_id" in query_response.obs_args()
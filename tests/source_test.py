@@ -0,0 +1,58 @@
+"""Tests for page sources."""
+# pylint: disable=missing-class-docstring, no-self-use, missing-function-docstring
+# pylint: disable=redefined-outer-name
+import pytest
+
+from dronefly.core.menus.source import GroupByPageSource
+
+
+def first_letter(word):
+    return word[0]
+
+
+class TestGroupByPageSource:
+    def test_groups(self):
+        source = GroupByPageSource(
+            ["bee", "ant", "bat", "asp", "cat"], key=first_letter, per_page=5
+        )
+        assert [(entry.key, entry.items) for entry in source.entries] == [
+            ("a", ["ant", "asp"]),
+            ("b", ["bee", "bat"]),
+            ("c", ["cat"]),
+        ]
+
+    def test_presorted(self):
+        entries = ["ant", "asp", "bat", "bee", "cat"]
+        source = GroupByPageSource(entries, key=first_letter, per_page=5)
+        assert [entry.items for entry in source.entries] == [
+            ["ant", "asp"],
+            ["bat", "bee"],
+            ["cat"],
+        ]
+
+    def test_unsorted(self):
+        source = GroupByPageSource(
+            iter(["bee", "ant", "bat"]), key=first_letter, per_page=5, sort=False
+        )
+        assert [(entry.key, entry.items) for entry in source.entries] == [
+            ("b", ["bee"]),
+            ("a", ["ant"]),
+            ("b", ["bat"]),
+        ]
+
+    def test_chunked(self):
+        source = GroupByPageSource(
+            ["ant", "asp", "auk", "bat"], key=first_letter, per_page=2
+        )
+        assert [(entry.key, entry.items) for entry in source.entries] == [
+            ("a", ["ant", "asp"]),
+            ("a", ["auk"]),
+            ("b", ["bat"]),
+        ]
+        assert source.get_max_pages() == 3
+
+    @pytest.mark.asyncio
+    async def test_get_page(self):
+        source = GroupByPageSource(["bat", "ant"], key=first_letter, per_page=2)
+        entry = await source.get_page(1)
+        assert entry.key == "b"
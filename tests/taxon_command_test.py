@@ -8,8 +8,11 @@ import pytest
 from dronefly.core import Commands
 from dronefly.core.commands import Context  # noqa: F401
 
+# Observation counts change daily, so are replaced with a fixed count:
+_OBS_COUNT_RE = re.compile(r"\[[0-9,]*?\]")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def cmd():
     return Commands()
 
@@ -22,7 +25,7 @@ def ctx():
 # TODO: Mock communication with iNatClient
 @pytest.mark.asyncio
 async def test_taxon_with_result(cmd, ctx):
-    response = re.sub(r"\[[0-9,]*?\]", "[19,999,999]", await cmd.taxon(ctx, "birds"))
+    response = _OBS_COUNT_RE.sub("[19,999,999]", await cmd.taxon(ctx, "birds"))
     assert response == (
         "[Class Aves (Birds)](https://www.inaturalist.org/taxa/3)\nis a class with "
         "[19,999,999](https://www.inaturalist.org/observations?taxon_id=3) observations in: "
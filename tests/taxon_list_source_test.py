@@ -0,0 +1,116 @@
+"""Tests for TaxonListSource."""
+# pylint: disable=missing-class-docstring, no-self-use, missing-function-docstring
+# pylint: disable=redefined-outer-name
+import re
+
+import pytest
+from pyinaturalist import Taxon
+
+from dronefly.core.formatters.generic import TaxonListFormatter
+from dronefly.core.menus.source import LazyListPageSource
+from dronefly.core.menus.taxon_list import TaxonListSource
+from dronefly.core.query.query import QueryResponse
+
+
+# Life, Animalia, and 48 species of Animalia, built once for all tests:
+_MOCK_TAXON_PARAMS = (
+    dict(id=48460, name="Life", rank="stateofmatter", observations_count=1225),
+    dict(id=1, name="Animalia", rank="kingdom", observations_count=1225),
+    *(
+        dict(
+            id=1000 + i,
+            name=f"Species {i:02d}",
+            rank="species",
+            ancestor_ids=[48460, 1],
+            is_active=True,
+            observations_count=i,
+        )
+        for i in range(2, 50)
+    ),
+)
+
+
+@pytest.fixture(scope="module")
+def mock_taxa():
+    return [Taxon(**params) for params in _MOCK_TAXON_PARAMS]
+
+
+@pytest.fixture
+def mock_formatter(mock_taxa):
+    return TaxonListFormatter(mock_taxa, "species", QueryResponse(), per_page=20)
+
+
+@pytest.fixture
+def source(mock_formatter):
+    return TaxonListSource(mock_formatter)
+
+
+def test_max_pages(source):
+    assert source.get_max_pages() == 3
+
+
+def test_taxa_filtered_on_demand(mock_formatter):
+    assert "_filtered" not in vars(mock_formatter)
+    source = TaxonListSource(mock_formatter)
+    assert "_filtered" not in vars(mock_formatter)
+    assert source.get_max_pages() == 3
+    assert len(mock_formatter.taxa) == 48
+
+
+def test_pages_formatted_on_demand(mock_formatter, mocker):
+    format_page = mocker.spy(TaxonListFormatter, "format_page")
+    source = TaxonListSource(mock_formatter)
+    format_page.assert_not_called()
+    assert source.get_max_pages() == 3
+    format_page.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "page_number,first,last",
+    [
+        (0, "Species 02", "Species 21"),
+        (1, "Species 22", "Species 41"),
+        (2, "Species 42", "Species 49"),
+    ],
+)
+async def test_get_page(source, mock_formatter, page_number, first, last):
+    page = await source.get_page(page_number)
+    assert page == mock_formatter.format_page(page_number)
+    names = re.findall(r"\[\*(.*?)\*\]", page)
+    assert (names[0], names[-1]) == (first, last)
+
+
+@pytest.mark.asyncio
+async def test_get_last_page_total(source):
+    page = await source.get_page(2)
+    assert page.endswith("Total: 48 species")
+
+
+@pytest.mark.asyncio
+async def test_get_page_cached(source, mocker):
+    format_page = mocker.spy(source.formatter, "format_page")
+    first = await source.get_page(0)
+    assert await source.get_page(0) is first
+    format_page.assert_called_once_with(0)
+
+
+@pytest.mark.asyncio
+async def test_get_page_out_of_range(source):
+    with pytest.raises(IndexError):
+        await source.get_page(3)
+
+
+@pytest.mark.asyncio
+async def test_get_page_cache_bounded(source, mocker):
+    LazyListPageSource.__init__(source, cache_size=2)
+    format_page = mocker.spy(source.formatter, "format_page")
+    for page_number in (0, 1, 0, 2, 0, 1):
+        await source.get_page(page_number)
+    # Page 1 was least recently used when page 2 came in, so only it is redone:
+    assert [call.args for call in format_page.call_args_list] == [
+        (0,),
+        (1,),
+        (2,),
+        (1,),
+    ]
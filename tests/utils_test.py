@@ -0,0 +1,54 @@
+"""Tests for utils."""
+# pylint: disable=missing-class-docstring, no-self-use, missing-function-docstring
+import pytest
+from pyinaturalist import Place, Taxon, User
+
+from dronefly.core.query.query import QueryResponse
+from dronefly.core.utils import lifelists_url_from_query_response, obs_url_from_v1
+
+
+class TestObsUrlFromV1:
+    def test_no_params(self):
+        assert obs_url_from_v1({}) == "https://www.inaturalist.org/observations"
+
+    @pytest.mark.parametrize(
+        "params,expected",
+        [
+            ({"taxon_id": 3, "verifiable": "true"}, "taxon_id=3&verifiable=true"),
+            ({"observed_on": "2023-01-02", "taxon_id": 3}, "on=2023-01-02&taxon_id=3"),
+            ({"taxon_id": [3, 4]}, "taxon_id=%5B3%2C+4%5D"),
+            (
+                {"taxon_id": [3, 4], "verifiable": "any"},
+                "taxon_id=%5B3%2C+4%5D&verifiable=any",
+            ),
+            ({"q": "Anna's hummingbird"}, "q=Anna%27s+hummingbird"),
+        ],
+    )
+    def test_params(self, params, expected):
+        url = "https://www.inaturalist.org/observations?" + expected
+        assert obs_url_from_v1(params) == url
+        assert obs_url_from_v1(params) == url
+
+    def test_equal_values_of_different_types(self):
+        base_url = "https://www.inaturalist.org/observations?"
+        assert obs_url_from_v1({"x": True, "y": 1}) == base_url + "x=True&y=1"
+        assert obs_url_from_v1({"x": 1, "y": 1}) == base_url + "x=1&y=1"
+        assert obs_url_from_v1({"x": 1.0, "y": 1}) == base_url + "x=1.0&y=1"
+
+
+class TestLifelistsUrlFromQueryResponse:
+    def test_taxon_and_place(self):
+        query_response = QueryResponse(
+            user=User(id=1, login="kueda"), taxon=Taxon(id=3), place=Place(id=6712)
+        )
+        assert lifelists_url_from_query_response(query_response) == (
+            "https://www.inaturalist.org/lifelists/kueda?taxon_id=3&place_id=6712"
+        )
+
+    def test_multiple_places(self):
+        query_response = QueryResponse(
+            user=User(id=1, login="kueda"), options={"place_id": "1,2"}
+        )
+        assert lifelists_url_from_query_response(query_response) == (
+            "https://www.inaturalist.org/lifelists/kueda"
+        )